@@ -26,6 +26,6 @@ echo "⬆️  Upgrading pip..."
 python -m pip install --upgrade pip
 
 echo "📦 Installing conversion dependencies..."
-pip install rdflib jinja2 pyshacl owlrl
+pip install rdflib jinja2 pyshacl owlrl pyjelly
 
 echo "✅ Environment ready. Activate it later with: source $VENV_DIR/bin/activate"
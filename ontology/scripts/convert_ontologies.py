@@ -6,19 +6,47 @@ matching the requested basis extension (default: ``ttl``). Each file is
 parsed with ``rdflib`` and serialised to JSON-LD, RDF/XML (``.owl``), and
 Turtle in the deployment directory while also emitting a human-readable
 HTML catalogue using a Jinja2 template.
+
+When the optional ``pyjelly`` package is installed, each parsed source is
+also cached next to it as a Jelly binary sidecar (``<name>.ttl.jelly``) that
+is loaded instead of re-parsing the source while it is newer than the source.
+Pass ``--no-cache`` to always parse the sources.
 """
 from __future__ import annotations
 
 import argparse
+import functools
+import os
+import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Set, Tuple
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple, Type
 
-import rdflib
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
 from rdflib import Graph, Literal, URIRef
-from rdflib.namespace import DCTERMS, OWL, RDF, RDFS, SKOS
+from rdflib.namespace import DCTERMS, OWL, RDF, RDFS, SKOS, DefinedNamespace
+from rdflib.term import Node
+
+try:
+    from pyjelly.integrations.rdflib.serialize import SerializerOptions, stream_frames
+    from pyjelly.options import StreamParameters
+    from pyjelly.serialize.ioutils import write_delimited
+    from pyjelly.serialize.streams import TripleStream
+except ImportError:  # pyjelly is optional; without it sources are always parsed.
+    HAVE_JELLY = False
+else:
+    HAVE_JELLY = True
+
+JELLY_CACHE_SUFFIX = ".jelly"
+# Buffer size for files written incrementally (Jelly frames, HTML chunks).
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Resolved once at import; used for the command-line defaults.
+_HERE = Path(__file__).resolve().parent
+_ONTOLOGY_ROOT = _HERE.parent
 
 # Map filename extensions to rdflib parse formats.
 FORMAT_BY_EXT: Dict[str, str] = {
@@ -30,6 +58,48 @@ FORMAT_BY_EXT: Dict[str, str] = {
     ".xml": "xml",
 }
 
+# Output key (also the file extension) and rdflib serialisation format, in
+# the order the artefacts are produced.
+SERIALISATION_FORMATS: Tuple[Tuple[str, str], ...] = (
+    ("ttl", "turtle"),
+    ("jsonld", "json-ld"),
+    ("owl", "xml"),
+)
+
+# Optional N-Triples artefact (``--ntriples``). It writes full IRIs, so it
+# skips the per-term qname lookups that dominate Turtle serialisation.
+NTRIPLES_FORMAT: Tuple[str, str] = ("nt", "nt")
+
+# Prefixes bound on every graph (without replacing source bindings) so the
+# generated artefacts use the familiar names for the core vocabularies.
+COMMON_PREFIXES: Tuple[Tuple[str, Type[DefinedNamespace]], ...] = (
+    ("rdf", RDF),
+    ("rdfs", RDFS),
+    ("owl", OWL),
+    ("skos", SKOS),
+    ("dcterms", DCTERMS),
+)
+
+# Predicates read by the HTML collectors; index_graph buckets their objects
+# by subject so the collectors avoid one store lookup per subject/predicate.
+INDEXED_PREDICATES: FrozenSet[URIRef] = frozenset(
+    {
+        RDF.type,
+        RDFS.label,
+        RDFS.comment,
+        RDFS.subClassOf,
+        RDFS.domain,
+        RDFS.range,
+        RDFS.subPropertyOf,
+        SKOS.definition,
+        SKOS.example,
+        OWL.inverseOf,
+    }
+)
+
+# predicate -> subject -> objects, in graph order.
+GraphIndex = Dict[URIRef, Dict[Node, List[Node]]]
+
 
 @dataclass
 class OntologyHeader:
@@ -66,13 +136,13 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
         "--source-dir",
-        default=Path(__file__).resolve().parents[1] / "src",
+        default=_ONTOLOGY_ROOT / "src",
         type=Path,
         help="Directory containing ontology source files (default: ontology/src)",
     )
     parser.add_argument(
         "--deployment-dir",
-        default=Path(__file__).resolve().parents[1] / "deployment",
+        default=_ONTOLOGY_ROOT / "deployment",
         type=Path,
         help="Directory to write generated artefacts (default: ontology/deployment)",
     )
@@ -84,10 +154,41 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser.add_argument(
         "--template",
         type=Path,
-        default=Path(__file__).resolve().parent / "templates" / "ontology.html.j2",
+        default=_HERE / "templates" / "ontology.html.j2",
         help="HTML Jinja2 template to render human-readable output",
     )
-    return parser.parse_args(argv)
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of ontology files to convert in parallel (default: CPU count; 1 disables parallelism)",
+    )
+    parser.add_argument(
+        "--ntriples",
+        action="store_true",
+        help="Also write an N-Triples (.nt) artefact for each ontology",
+    )
+    parser.add_argument(
+        "--no-turtle",
+        dest="turtle",
+        action="store_false",
+        help="Skip the normalised Turtle (.ttl) artefact",
+    )
+    parser.add_argument(
+        "--copy-source-turtle",
+        action="store_true",
+        help="Publish .ttl sources verbatim as the Turtle artefact instead of re-serialising them",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Always parse the sources instead of using (or writing) Jelly cache sidecars",
+    )
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    return args
 
 
 def ensure_default_prefix(g: Graph, ontology_iri: Optional[str]) -> None:
@@ -96,35 +197,31 @@ def ensure_default_prefix(g: Graph, ontology_iri: Optional[str]) -> None:
     base_ns = ontology_iri
     if not base_ns.endswith(("#", "/")):
         base_ns = base_ns + "#"
-    try:
-        g.namespace_manager.bind("", rdflib.term.URIRef(base_ns), replace=False)
-    except Exception:
-        pass
+    g.namespace_manager.bind("", URIRef(base_ns), replace=False)
 
 
 def ensure_common_prefixes(graph: Graph) -> None:
-    common = {
-        "rdf": RDF,
-        "rdfs": RDFS,
-        "owl": OWL,
-        "skos": SKOS,
-        "dcterms": DCTERMS,
-    }
-    for pref, ns in common.items():
-        try:
-            graph.namespace_manager.bind(pref, ns, replace=False)
-        except Exception:
-            pass
+    nm = graph.namespace_manager
+    for pref, ns in COMMON_PREFIXES:
+        nm.bind(pref, ns, replace=False)
 
 
 def compute_used_prefixes(g: Graph) -> List[Dict[str, str]]:
     nm = g.namespace_manager
+    compute_qname = nm.compute_qname
     used_prefixes: Set[str] = set()
+    # IRIs repeat heavily across triples (predicates especially), so only
+    # resolve each distinct IRI against the namespace manager once. This goes
+    # through compute_qname rather than a plain startswith match on the bound
+    # namespaces: it memoises per IRI (the serialisers have already warmed it)
+    # and picks, or generates, the same prefix the Turtle output uses.
+    seen: Set[URIRef] = set()
     for s, p, o in g:
         for term in (s, p, o):
-            if isinstance(term, rdflib.term.URIRef):
+            if isinstance(term, URIRef) and term not in seen:
+                seen.add(term)
                 try:
-                    prefix, _ns, _name = nm.compute_qname(term)
+                    prefix, _ns, _name = compute_qname(term)
                     if prefix is not None:
                         used_prefixes.add(prefix)
                 except Exception:
@@ -137,13 +234,18 @@ def compute_used_prefixes(g: Graph) -> List[Dict[str, str]]:
     return prefixes
 
 
-def literal_by_lang(values: List[Literal], preferred: Optional[List[str]] = None) -> Tuple[Optional[Literal], List[Literal]]:
-    preferred = preferred or ["en"]
-    by_lang = {v.language: v for v in values if isinstance(v, Literal)}
-    for lang in preferred:
-        if lang in by_lang:
-            return by_lang[lang], values
-    return (values[0] if values else None), values
+def literal_by_lang(
+    values: List[Literal], preferred: Optional[Sequence[str]] = ("en",)
+) -> Tuple[Optional[Literal], List[Literal]]:
+    if not values:
+        return None, values
+    # Scan from the end so the last literal in a language wins, as it did
+    # when the candidates were collected into a language-keyed dict.
+    for lang in preferred or ("en",):
+        for v in reversed(values):
+            if isinstance(v, Literal) and v.language == lang:
+                return v, values
+    return values[0], values
 
 
 def qname(graph: Graph, term: URIRef) -> str:
@@ -153,10 +255,40 @@ def qname(graph: Graph, term: URIRef) -> str:
         return str(term)
 
 
+def make_qname(graph: Graph) -> Callable[[URIRef], str]:
+    """Return a ``qname`` variant bound to ``graph`` that memoises results per IRI."""
+    cache: Dict[URIRef, str] = {}
+    normalize = graph.namespace_manager.normalizeUri
+
+    def q(term: URIRef) -> str:
+        value = cache.get(term)
+        if value is None:
+            try:
+                value = normalize(term)
+            except Exception:
+                value = str(term)
+            cache[term] = value
+        return value
+
+    return q
+
+
 def get_literals(graph: Graph, s: URIRef, p: URIRef) -> List[Literal]:
     return [o for o in graph.objects(s, p) if isinstance(o, Literal)]
 
 
+def subject_literals_by_pred(
+    graph: Graph, s: Node, preds: Sequence[URIRef]
+) -> Dict[URIRef, List[Literal]]:
+    """Collect the literal values of several predicates of ``s`` in one store lookup."""
+    out: Dict[URIRef, List[Literal]] = {p: [] for p in preds}
+    for p, o in graph.predicate_objects(s):
+        values = out.get(p)
+        if values is not None and isinstance(o, Literal):
+            values.append(o)
+    return out
+
+
 def collect_ontology_info(g: Graph) -> OntologyHeader:
     ontologies = list(g.subjects(RDF.type, OWL.Ontology))
     iri: Optional[str] = None
@@ -165,33 +297,64 @@ def collect_ontology_info(g: Graph) -> OntologyHeader:
     if ontologies:
         ont = ontologies[0]
         iri = str(ont)
-        titles = get_literals(g, ont, DCTERMS.title)
-        title_literal, _ = literal_by_lang(titles)
+        literals = subject_literals_by_pred(g, ont, (DCTERMS.title, DCTERMS.description))
+        title_literal, _ = literal_by_lang(literals[DCTERMS.title])
         if title_literal:
             title = str(title_literal)
-        descriptions = get_literals(g, ont, DCTERMS.description)
-        desc_literal, _ = literal_by_lang(descriptions)
+        desc_literal, _ = literal_by_lang(literals[DCTERMS.description])
         if desc_literal:
             description = str(desc_literal)
     return OntologyHeader(iri=iri, title=title, description=description)
 
 
-def collect_classes(g: Graph) -> List[ClassInfo]:
-    classes: Set[URIRef] = set(s for s in g.subjects(RDF.type, OWL.Class))
+def index_graph(g: Graph, predicates: FrozenSet[URIRef] = INDEXED_PREDICATES) -> GraphIndex:
+    """Bucket the objects of ``predicates`` by subject in one sweep over ``g``.
+
+    Objects are gathered per subject (rather than from a flat ``for s, p, o in
+    g`` scan, which follows the store's hash order) so each list keeps the
+    order the values appear in the source, as ``g.objects(s, p)`` would.
+    """
+    idx: GraphIndex = {p: {} for p in predicates}
+    for s in g.subjects(unique=True):
+        for p, o in g.predicate_objects(s):
+            bucket = idx.get(p)
+            if bucket is not None:
+                bucket.setdefault(s, []).append(o)
+    return idx
+
+
+def indexed_literals(bucket: Dict[Node, List[Node]], s: Node) -> List[Literal]:
+    return [o for o in bucket.get(s, ()) if isinstance(o, Literal)]
+
+
+def collect_classes(g: Graph, idx: Optional[GraphIndex] = None) -> List[ClassInfo]:
+    if idx is None:
+        idx = index_graph(g)
+    q = make_qname(g)
+    # Resolve namespace terms and index buckets once; attribute access on
+    # rdflib namespaces is comparatively slow inside the per-class loop.
+    owl_class = OWL.Class
+    labels_of = idx[RDFS.label]
+    definitions_of = idx[SKOS.definition]
+    comments_of = idx[RDFS.comment]
+    examples_of = idx[SKOS.example]
+    superclasses_of = idx[RDFS.subClassOf]
     items: List[ClassInfo] = []
-    for s in classes:
-        labels = get_literals(g, s, RDFS.label)
+    for s, types in idx[RDF.type].items():
+        if owl_class not in types:
+            continue
+        labels = indexed_literals(labels_of, s)
         label_literal, _ = literal_by_lang(labels)
-        label = str(label_literal) if label_literal else qname(g, s)
+        label = str(label_literal) if label_literal else q(s)
         items.append(
             ClassInfo(
                 iri=str(s),
-                qname=qname(g, s),
+                qname=q(s),
                 label=label,
-                definitions=get_literals(g, s, SKOS.definition),
-                comments=get_literals(g, s, RDFS.comment),
-                examples=get_literals(g, s, SKOS.example),
-                subClassOf=[qname(g, o) for o in g.objects(s, RDFS.subClassOf) if isinstance(o, URIRef)],
+                definitions=indexed_literals(definitions_of, s),
+                comments=indexed_literals(comments_of, s),
+                examples=indexed_literals(examples_of, s),
+                subClassOf=[q(o) for o in superclasses_of.get(s, ()) if isinstance(o, URIRef)],
             )
         )
     items.sort(key=lambda x: (x.label.lower(), x.qname))
@@ -206,30 +369,54 @@ def property_kind(g: Graph, term: URIRef) -> str:
     return "Property"
 
 
-def collect_properties(g: Graph) -> List[PropertyInfo]:
-    props: Set[URIRef] = set(s for s in g.subjects(RDF.type, OWL.ObjectProperty))
-    props |= set(s for s in g.subjects(RDF.type, OWL.DatatypeProperty))
-    props |= set(s for s in g.subjects(RDF.type, RDF.Property))
+def property_kind_from_types(types: Sequence[Node]) -> str:
+    """Like :func:`property_kind` but for an already collected list of ``rdf:type`` values."""
+    if OWL.ObjectProperty in types:
+        return "ObjectProperty"
+    if OWL.DatatypeProperty in types:
+        return "DatatypeProperty"
+    return "Property"
+
+
+PROPERTY_TYPES: FrozenSet[URIRef] = frozenset({OWL.ObjectProperty, OWL.DatatypeProperty, RDF.Property})
 
+
+def collect_properties(g: Graph, idx: Optional[GraphIndex] = None) -> List[PropertyInfo]:
+    if idx is None:
+        idx = index_graph(g)
+    inverse_of = idx[OWL.inverseOf]
+    inverse_of_rev: Dict[Node, List[Node]] = {}
+    for x, targets in inverse_of.items():
+        for o in targets:
+            inverse_of_rev.setdefault(o, []).append(x)
+
+    q = make_qname(g)
+    labels_of = idx[RDFS.label]
+    comments_of = idx[RDFS.comment]
+    domains_of = idx[RDFS.domain]
+    ranges_of = idx[RDFS.range]
+    superproperties_of = idx[RDFS.subPropertyOf]
     items: List[PropertyInfo] = []
-    for s in props:
-        labels = get_literals(g, s, RDFS.label)
+    for s, types in idx[RDF.type].items():
+        if PROPERTY_TYPES.isdisjoint(types):
+            continue
+        labels = indexed_literals(labels_of, s)
         label_literal, _ = literal_by_lang(labels)
-        label = str(label_literal) if label_literal else qname(g, s)
-        domain = [qname(g, o) for o in g.objects(s, RDFS.domain) if isinstance(o, URIRef)]
-        rng = [qname(g, o) for o in g.objects(s, RDFS.range) if isinstance(o, URIRef)]
-        sub_props = [qname(g, o) for o in g.objects(s, RDFS.subPropertyOf) if isinstance(o, URIRef)]
-        inverses_set: Set[URIRef] = set(o for o in g.objects(s, OWL.inverseOf) if isinstance(o, URIRef))
-        inverses_set |= set(x for x in g.subjects(OWL.inverseOf, s) if isinstance(x, URIRef))
-        inverses = [qname(g, u) for u in sorted(inverses_set, key=lambda u: qname(g, u))]
+        label = str(label_literal) if label_literal else q(s)
+        domain = [q(o) for o in domains_of.get(s, ()) if isinstance(o, URIRef)]
+        rng = [q(o) for o in ranges_of.get(s, ()) if isinstance(o, URIRef)]
+        sub_props = [q(o) for o in superproperties_of.get(s, ()) if isinstance(o, URIRef)]
+        inverses = sorted(
+            {q(u) for u in chain(inverse_of.get(s, ()), inverse_of_rev.get(s, ())) if isinstance(u, URIRef)}
+        )
 
         items.append(
             PropertyInfo(
                 iri=str(s),
-                qname=qname(g, s),
+                qname=q(s),
                 label=label,
-                kind=property_kind(g, s),
-                comments=get_literals(g, s, RDFS.comment),
+                kind=property_kind_from_types(types),
+                comments=indexed_literals(comments_of, s),
                 domain=domain,
                 range=rng,
                 subPropertyOf=sub_props,
@@ -240,32 +427,95 @@ def collect_properties(g: Graph) -> List[PropertyInfo]:
     return items
 
 
-def load_graph(path: Path) -> Graph:
+def jelly_cache_path(path: Path) -> Path:
+    return path.with_suffix(path.suffix + JELLY_CACHE_SUFFIX)
+
+
+def write_jelly_cache(g: Graph, cache: Path) -> None:
+    """Write ``g`` (triples and prefix bindings) to a Jelly sidecar at ``cache``.
+
+    rdflib's own Jelly serialiser walks the store in hash order, so triples are
+    streamed per subject instead; that keeps each subject's objects in source
+    order, which the HTML catalogue relies on.
+    """
+    stream = TripleStream.for_rdflib(
+        options=SerializerOptions(params=StreamParameters(namespace_declarations=True))
+    )
+    stream.enroll()
+    for prefix, ns in g.namespaces():
+        stream.namespace_declaration(prefix, str(ns))
+    triples = ((s, p, o) for s in g.subjects(unique=True) for p, o in g.predicate_objects(s))
+    tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("wb", buffering=WRITE_BUFFER_SIZE) as fh:
+            for frame in stream_frames(stream, triples):
+                write_delimited(frame, fh)
+        os.replace(tmp, cache)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def parse_source(g: Graph, path: Path, fmt: str, use_cache: bool) -> None:
+    if not (use_cache and HAVE_JELLY):
+        g.parse(path, format=fmt)
+        return
+    cache = jelly_cache_path(path)
+    if cache.exists() and cache.stat().st_mtime >= path.stat().st_mtime:
+        try:
+            g.parse(cache, format="jelly")
+            return
+        except Exception as exc:
+            print(f"  ! ignoring unreadable cache {cache}: {exc}", file=sys.stderr)
+            g.remove((None, None, None))
+    g.parse(path, format=fmt)
+    try:
+        write_jelly_cache(g, cache)
+    except OSError as exc:
+        print(f"  ! could not write cache {cache}: {exc}", file=sys.stderr)
+
+
+def load_graph(path: Path, use_cache: bool = True) -> Tuple[Graph, OntologyHeader]:
     fmt = FORMAT_BY_EXT.get(path.suffix.lower())
     if fmt is None:
         raise ValueError(f"Unsupported input extension for {path}")
+    # A fresh Graph per file is deliberate: clearing a reused graph's triples
+    # keeps its prefix bindings (the Memory store cannot unbind), which would
+    # leak one module's prefixes into the next module's artefacts.
     g = Graph()
-    g.parse(path, format=fmt)
+    parse_source(g, path, fmt, use_cache)
     ensure_common_prefixes(g)
     header = collect_ontology_info(g)
     ensure_default_prefix(g, header.iri)
-    return g
+    return g, header
 
 
-def render_html(graph: Graph, base_name: str, template_path: Path, output_path: Path, source_path: Path) -> None:
+@functools.lru_cache(maxsize=None)
+def _get_template(template_path: Path) -> Template:
+    # Compile the template once per run rather than once per ontology file.
     env = Environment(
         loader=FileSystemLoader(template_path.parent),
         autoescape=select_autoescape(["html", "xml"]),
     )
-    tmpl = env.get_template(template_path.name)
-
-    ontology = collect_ontology_info(graph)
-    classes = collect_classes(graph)
-    properties = collect_properties(graph)
+    return env.get_template(template_path.name)
+
+
+def render_html(
+    graph: Graph,
+    header: OntologyHeader,
+    base_name: str,
+    template_path: Path,
+    output_path: Path,
+    source_path: Path,
+) -> None:
+    tmpl = _get_template(template_path)
+
+    idx = index_graph(graph)
+    classes = collect_classes(graph, idx)
+    properties = collect_properties(graph, idx)
     prefixes = compute_used_prefixes(graph)
 
-    html = tmpl.render(
-        ontology=ontology,
+    stream = tmpl.stream(
+        ontology=header,
         classes=classes,
         properties=properties,
         prefixes=prefixes,
@@ -273,35 +523,92 @@ def render_html(graph: Graph, base_name: str, template_path: Path, output_path:
         source_path=source_path,
     )
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(html, encoding="utf-8")
-
-
-def serialise_graph(graph: Graph, dest_dir: Path, base_name: str) -> Dict[str, Path]:
+    # Stream the rendered chunks straight to disk instead of materialising
+    # the whole catalogue as one string first.
+    with output_path.open("wb", buffering=WRITE_BUFFER_SIZE) as fh:
+        stream.dump(fh, encoding="utf-8")
+
+
+def serialise_graph(
+    graph: Graph,
+    dest_dir: Path,
+    base_name: str,
+    formats: Sequence[Tuple[str, str]] = SERIALISATION_FORMATS,
+    turtle_source: Optional[Path] = None,
+) -> Dict[str, Path]:
+    """Write ``graph`` in each of ``formats`` under ``dest_dir``.
+
+    When ``turtle_source`` is given it is copied as the ``ttl`` artefact
+    instead of re-serialising the graph. That is only valid while the graph
+    holds exactly the source's triples; this module merely adds prefix
+    bindings, which a well-formed source does not need.
+    """
     dest_dir.mkdir(parents=True, exist_ok=True)
-    outputs = {
-        "ttl": dest_dir / f"{base_name}.ttl",
-        "jsonld": dest_dir / f"{base_name}.jsonld",
-        "owl": dest_dir / f"{base_name}.owl",
-    }
-    graph.serialize(destination=outputs["ttl"], format="turtle")
-    graph.serialize(destination=outputs["jsonld"], format="json-ld")
-    graph.serialize(destination=outputs["owl"], format="xml")
+    outputs = {key: dest_dir / f"{base_name}.{key}" for key, _fmt in formats}
+    # The serialisers share (and may bind new prefixes on) the graph's
+    # namespace manager, so they run one after another; only the file writes
+    # are handed off so they overlap with producing the next format.
+    with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+        writes = []
+        for key, fmt in formats:
+            if key == "ttl" and turtle_source is not None:
+                writes.append(executor.submit(shutil.copyfile, turtle_source, outputs[key]))
+            else:
+                data = graph.serialize(format=fmt, encoding="utf-8")
+                writes.append(executor.submit(outputs[key].write_bytes, data))
+        for write in writes:
+            write.result()
     return outputs
 
 
-def convert_file(path: Path, source_dir: Path, deployment_dir: Path, template_path: Path) -> Dict[str, Path]:
-    graph = load_graph(path)
+def convert_file(
+    path: Path,
+    source_dir: Path,
+    deployment_dir: Path,
+    template_path: Path,
+    use_cache: bool = True,
+    formats: Sequence[Tuple[str, str]] = SERIALISATION_FORMATS,
+    copy_source_turtle: bool = False,
+) -> Dict[str, Path]:
+    graph, header = load_graph(path, use_cache)
     relative = path.relative_to(source_dir)
     base_name = relative.stem
     dest_dir = deployment_dir / relative.parent
 
-    serialised = serialise_graph(graph, dest_dir, base_name)
+    turtle_source = path if copy_source_turtle and path.suffix.lower() == ".ttl" else None
+    serialised = serialise_graph(graph, dest_dir, base_name, formats, turtle_source)
     html_path = dest_dir / f"{base_name}.html"
-    render_html(graph, base_name, template_path, html_path, relative)
+    render_html(graph, header, base_name, template_path, html_path, relative)
     serialised["html"] = html_path
     return serialised
 
 
+def find_source_files(root: Path, suffix: str) -> List[Path]:
+    """Return files under ``root`` whose names end with ``suffix``, sorted.
+
+    Walks with ``os.scandir`` so directory entries come with their cached
+    type information and only matches are turned into ``Path`` objects.
+    Symlinked directories are not followed, matching ``Path.rglob``.
+    """
+    matches: List[Path] = []
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(suffix):
+                    matches.append(Path(entry.path))
+    matches.sort()
+    return matches
+
+
+def report_outputs(path: Path, outputs: Dict[str, Path], source_dir: Path, deployment_dir: Path) -> None:
+    print(f"- {path.relative_to(source_dir)}")
+    for label, out_path in outputs.items():
+        print(f"  • {label}: {out_path.relative_to(deployment_dir)}")
+
+
 def run(argv: Optional[Sequence[str]] = None) -> int:
     args = parse_args(argv)
     source_dir = args.source_dir.resolve()
@@ -313,7 +620,7 @@ def run(argv: Optional[Sequence[str]] = None) -> int:
         raise FileNotFoundError(f"Template not found: {template_path}")
 
     basis_pattern = f"*.{basis}"
-    source_files = sorted(source_dir.rglob(basis_pattern))
+    source_files = find_source_files(source_dir, f".{basis}")
     if not source_files:
         print(f"No source files matching {basis_pattern} under {source_dir}")
         return 1
@@ -321,11 +628,36 @@ def run(argv: Optional[Sequence[str]] = None) -> int:
     print(f"Converting {len(source_files)} ontologies from {source_dir} using basis '.{basis}'...")
     deployment_dir.mkdir(parents=True, exist_ok=True)
 
-    for path in source_files:
-        print(f"- {path.relative_to(source_dir)}")
-        outputs = convert_file(path, source_dir, deployment_dir, template_path)
-        for label, out_path in outputs.items():
-            print(f"  • {label}: {out_path.relative_to(deployment_dir)}")
+    formats = [fmt for fmt in SERIALISATION_FORMATS if args.turtle or fmt[0] != "ttl"]
+    if args.ntriples:
+        formats.append(NTRIPLES_FORMAT)
+
+    jobs = min(args.jobs, len(source_files))
+    if jobs == 1:
+        for path in source_files:
+            outputs = convert_file(
+                path, source_dir, deployment_dir, template_path, args.use_cache, formats, args.copy_source_turtle
+            )
+            report_outputs(path, outputs, source_dir, deployment_dir)
+    else:
+        # Files are independent and write to disjoint paths, so convert them
+        # in worker processes and report in source order once each finishes.
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(
+                    convert_file,
+                    path,
+                    source_dir,
+                    deployment_dir,
+                    template_path,
+                    args.use_cache,
+                    formats,
+                    args.copy_source_turtle,
+                )
+                for path in source_files
+            ]
+            for path, future in zip(source_files, futures):
+                report_outputs(path, future.result(), source_dir, deployment_dir)
 
     print(f"✅ Finished writing artefacts to {deployment_dir}")
     return 0